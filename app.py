@@ -1,10 +1,6 @@
 import streamlit as st
-import pandas as pd
-from scraper_utils import scrape_website
-import base64
-from PIL import Image
-import io
-import requests
+from bookdata import BOOKS, BOOKS_DF, BY_ID, BY_TITLE, COVER_ORIGINS
+import re
 
 # Set page config for better mobile experience
 st.set_page_config(
@@ -15,9 +11,7 @@ st.set_page_config(
 )
 
 # Customize app appearance for mobile
-st.markdown(
-    """
-    <style>
+APP_CSS = """
     .main > div {
         padding-top: 1rem;
     }
@@ -36,10 +30,16 @@ st.markdown(
         box-shadow: 0 2px 10px rgba(0,0,0,0.1);
         margin-bottom: 1rem;
         transition: transform 0.3s;
+        display: flex;
+        gap: 1rem;
+        align-items: flex-start;
     }
     .book-card:hover {
         transform: translateY(-5px);
     }
+    .book-info {
+        flex: 1;
+    }
     .book-title {
         font-size: 1.2rem;
         font-weight: bold;
@@ -55,177 +55,93 @@ st.markdown(
             padding: 0.5rem;
         }
     }
-    </style>
-    """,
-    unsafe_allow_html=True
-)
+"""
 
-# Initialize session state
-if 'current_page' not in st.session_state:
-    st.session_state.current_page = 'home'
-if 'book_info' not in st.session_state:
-    st.session_state.book_info = {}
-
-# Books catalog data
-books = [
-    {
-        "id": 1,
-        "title": "1984",
-        "author": "George Orwell",
-        "year": 1949,
-        "genre": "Ficción distópica",
-        "description": "Una inquietante distopía que presenta un futuro totalitario donde el gobierno, encabezado por el omnipresente Gran Hermano, controla cada aspecto de la vida de los ciudadanos, incluyendo sus pensamientos. Winston Smith, un trabajador del Ministerio de la Verdad, comienza a cuestionar la realidad manipulada por el Partido y se rebela contra el sistema.",
-        "cover_url": "https://m.media-amazon.com/images/I/71kxa1-0mfL._AC_UF1000,1000_QL80_.jpg"
-    },
-    {
-        "id": 2,
-        "title": "El Octavo Clan",
-        "author": "Justine Evans",
-        "year": 2015,
-        "genre": "Ciencia ficción juvenil",
-        "description": "En un mundo postapocalíptico, la humanidad se ha dividido en siete clanes tras una guerra devastadora. Aislados unos de otros, cada clan posee una cualidad específica. Una joven llamada Edera descubre que pertenece a un misterioso octavo clan cuya existencia se ha mantenido en secreto, y que posee el poder de unir a todos los demás en una nueva era.",
-        "cover_url": "https://books.google.com.mx/books/publisher/content?id=8sEsCQAAQBAJ&pg=PP1&img=1&zoom=3&hl=en&bul=1&sig=ACfU3U3Lg71KTAafeRbTGNDyX_dobYSgHg&w=1280"
-    },
-    {
-        "id": 3,
-        "title": "Viaje al Centro de la Tierra",
-        "author": "Julio Verne",
-        "year": 1864,
-        "genre": "Aventura",
-        "description": "El profesor Otto Lidenbrock descubre un manuscrito antiguo que revela un pasaje secreto hacia el centro de la Tierra a través de un volcán en Islandia. Junto a su sobrino Axel y el guía Hans, emprende una expedición subterránea donde encuentran un mundo perdido con océanos, criaturas prehistóricas y fenómenos naturales extraordinarios, desafiando todas las teorías científicas conocidas.",
-        "cover_url": "https://books.google.com.mx/books/publisher/content?id=rIb6CQAAQBAJ&pg=PP1&img=1&zoom=3&hl=en&bul=1&sig=ACfU3U0U5ONttVdnMPiVaLxnZWjjRdCkqg&w=1280"
-    },
-    {
-        "id": 4,
-        "title": "Dune",
-        "author": "Frank Herbert",
-        "year": 1965,
-        "genre": "Ciencia ficción",
-        "description": "Ambientada en un futuro lejano, esta saga épica narra la batalla por el control del planeta desértico Arrakis, único lugar donde se encuentra la especia melange, sustancia que permite el viaje espacial y prolonga la vida. Paul Atreides, heredero de la Casa Atreides, debe navegar en un complejo universo de política intergaláctica, religión y ecología mientras descubre su propio destino como el Mesías que cambiará la galaxia.",
-        "cover_url": "https://m.media-amazon.com/images/I/81ym3QUd3KL._AC_UF1000,1000_QL80_.jpg"
-    },
-    {
-        "id": 5,
-        "title": "La Chica del Tren",
-        "author": "Paula Hawkins",
-        "year": 2015,
-        "genre": "Thriller psicológico",
-        "description": "Rachel Watson toma el mismo tren todos los días y pasa por la misma casa donde vive una pareja aparentemente perfecta. Un día, Rachel es testigo de algo impactante desde la ventana del tren y posteriormente se ve involucrada en un misterio de desaparición. A medida que intenta averiguar la verdad, debe enfrentar sus propios demonios, sus problemas de alcoholismo y sus recuerdos poco fiables en un retorcido juego psicológico.",
-        "cover_url": "https://books.google.com.mx/books/publisher/content?id=jWBACQAAQBAJ&pg=PP1&img=1&zoom=3&hl=en&bul=1&sig=ACfU3U2axiNlr-IWlWj0f64VWvc6AhZN3A&w=1280"
-    },
-    {
-        "id": 6,
-        "title": "El Código Da Vinci",
-        "author": "Dan Brown",
-        "year": 2003,
-        "genre": "Misterio",
-        "description": "Cuando el conservador del Louvre, Jacques Saunière, es asesinado, Robert Langdon, profesor de simbología de Harvard, se ve envuelto en una intrincada conspiración relacionada con obras de Leonardo da Vinci y un secreto que podría cambiar la historia del cristianismo. Junto a la criptógrafa Sophie Neveu, nieta de Saunière, Langdon debe descifrar complejos códigos y símbolos para encontrar el Santo Grial mientras escapa de las autoridades y de un asesino albino al servicio de una misteriosa organización eclesiástica.",
-        "cover_url": "https://books.google.com.mx/books/publisher/content?id=iHkPDQAAQBAJ&pg=PA1&img=1&zoom=3&hl=en&bul=1&sig=ACfU3U1tEHnYosKgTObPLqJBwuqYfC5J1g&w=1280"
-    },
-    {
-        "id": 7,
-        "title": "El Señor de los Anillos",
-        "author": "J.R.R. Tolkien",
-        "year": 1954,
-        "genre": "Fantasía épica",
-        "description": "En la Tierra Media, Frodo Bolsón recibe la misión de destruir un poderoso anillo en los fuegos del Monte del Destino. Su viaje épico, junto a la Comunidad del Anillo, define el destino de su mundo frente al oscuro poder de Sauron. La historia sigue las aventuras de Frodo y sus compañeros a través de los reinos de elfos, enanos y hombres, mientras son perseguidos por los servidores del Señor Oscuro y deben enfrentarse a traiciones, batallas épicas y sus propios miedos internos.",
-        "cover_url": "https://m.media-amazon.com/images/I/71jLBXtWJWL._AC_UF1000,1000_QL80_.jpg"
-    },
-    {
-        "id": 8,
-        "title": "Harry Potter y la Piedra Filosofal",
-        "author": "J.K. Rowling",
-        "year": 1997,
-        "genre": "Fantasía",
-        "description": "Harry Potter descubre en su undécimo cumpleaños que es hijo de magos y es invitado a estudiar en el Colegio Hogwarts de Magia y Hechicería. Allí, el joven mago aprende sobre su pasado, forma amistades con Ron Weasley y Hermione Granger, y descubre que el malvado Lord Voldemort, responsable de la muerte de sus padres, busca recuperar su poder a través de la legendaria Piedra Filosofal, capaz de otorgar la inmortalidad y convertir cualquier metal en oro.",
-        "cover_url": "https://books.google.com.mx/books/content?id=2zgRDXFWkm8C&pg=PA1&img=1&zoom=3&hl=en&bul=1&sig=ACfU3U02KFfmXr5RojH3rB8Sgh9x8VKnZg&w=1280"
-    },
-    {
-        "id": 9,
-        "title": "El Principito",
-        "author": "Antoine de Saint-Exupéry",
-        "year": 1943,
-        "genre": "Fábula",
-        "description": "Un piloto se encuentra perdido en el desierto del Sahara después de un aterrizaje forzoso. Allí conoce a un pequeño príncipe que viene de un asteroide lejano. A través de conversaciones filosóficas y encuentros con personajes simbólicos como el zorro, la rosa y el rey, el niño comparte sus viajes y enseña importantes lecciones sobre la amistad, el amor, la soledad y la importancia de ver con el corazón. Una fábula poética que trasciende edades y explora las paradojas de la naturaleza humana.",
-        "cover_url": "https://books.google.com.mx/books/publisher/content?id=103IAwAAQBAJ&pg=PP1&img=1&zoom=3&hl=en&bul=1&sig=ACfU3U2djg4yhc2ZsN3bw_MJRThHBqHeog&w=1280"
-    },
-    {
-        "id": 10,
-        "title": "Cien Años de Soledad",
-        "author": "Gabriel García Márquez",
-        "year": 1967,
-        "genre": "Realismo mágico",
-        "description": "Esta obra maestra narra la historia de la familia Buendía a lo largo de siete generaciones en el pueblo ficticio de Macondo. Desde su fundación por José Arcadio Buendía y Úrsula Iguarán hasta su apocalíptico final, la novela entrelaza lo cotidiano con lo fantástico: lluvias de flores, ascensiones al cielo, plagas de insomnio e insectos. A través de personajes memorables como Aureliano Buendía, Remedios la Bella y Úrsula, García Márquez crea una metáfora de la historia latinoamericana marcada por la repetición cíclica de nombres, características y destinos.",
-        "cover_url": "https://images-na.ssl-images-amazon.com/images/S/compressed.photo.goodreads.com/books/1348239033i/6669282.jpg"
-    }
-]
+# Inject the stylesheet once per process; Streamlit replays the cached
+# element on later reruns instead of re-running the markdown call
+@st.cache_resource(show_spinner=False)
+def inject_css():
+    preconnect = "".join(f'<link rel="preconnect" href="{origin}">' for origin in COVER_ORIGINS)
+    st.markdown(f"{preconnect}<style>{APP_CSS}</style>", unsafe_allow_html=True)
+    return True
 
 # Function to get book information from the web
 def get_book_info(title, author):
-    search_query = f"{title} {author} libro sinopsis"
-    try:
-        # This would typically search for more info about the book
-        # For this demo, we'll just return the existing info
-        for book in books:
-            if book["title"].lower() == title.lower():
-                return book
-        return None
-    except:
-        return None
+    # This would typically search for more info about the book
+    # For this demo, we'll just return the existing info
+    return BY_TITLE.get(title.lower())
 
-# Function to load image from URL
-def load_image_from_url(url):
-    try:
-        response = requests.get(url)
-        img = Image.open(io.BytesIO(response.content))
-        return img
-    except:
-        # Return a default image if the URL doesn't work
-        return None
+# Size parameters understood by the cover CDNs
+AMAZON_SIZE_RE = re.compile(r"\._AC_UF\d+,\d+_")
+AMAZON_PLAIN_RE = re.compile(r"(/[^/.]+)(\.jpg)$")
+GOOGLE_WIDTH_RE = re.compile(r"([?&])w=\d+")
+
+# Function to ask the cover CDN for an image resized to the given width
+def cover_thumbnail_url(url, width):
+    if "books.google." in url:
+        return GOOGLE_WIDTH_RE.sub(rf"\g<1>w={width}", url)
+    if AMAZON_SIZE_RE.search(url):
+        return AMAZON_SIZE_RE.sub(f"._AC_UF{width},{width}_", url)
+    if "images-amazon.com" in url:
+        return AMAZON_PLAIN_RE.sub(rf"\g<1>._SX{width}_\g<2>", url)
+    return url
+
+# Function to build a cover <img> tag that the browser fetches lazily
+def cover_img_html(url, width):
+    # Request twice the display width so covers stay sharp on high-DPI screens
+    src = cover_thumbnail_url(url, width * 2)
+    return (
+        f'<img src="{src}" loading="lazy" decoding="async" width="{width}" '
+        f'style="border-radius:6px" '
+        f'onerror="this.replaceWith(document.createTextNode(\'📚\'))">'
+    )
+
+# Functions to navigate between pages through the book_id query parameter
+def open_book(book_id):
+    st.query_params["book_id"] = str(book_id)
+
+def close_book():
+    st.query_params.pop("book_id", None)
 
 # Function to create book card
 def book_card(book):
-    col1, col2 = st.columns([1, 3])
-    with col1:
-        try:
-            st.image(book["cover_url"], width=100)
-        except:
-            st.write("📚")
+    # The whole card is a single markdown element; only the button is a widget
+    st.markdown(
+        f"<div class='book-card'>"
+        f"{cover_img_html(book.cover_url, 100)}"
+        f"<div class='book-info'>"
+        f"<div class='book-title'>{book.title}</div>"
+        f"<div class='book-author'>Por: {book.author}</div>"
+        f"<div>{book.genre} ({book.year})</div>"
+        f"</div>"
+        f"</div>",
+        unsafe_allow_html=True
+    )
     
-    with col2:
-        st.markdown(f"<div class='book-title'>{book['title']}</div>", unsafe_allow_html=True)
-        st.markdown(f"<div class='book-author'>Por: {book['author']}</div>", unsafe_allow_html=True)
-        st.markdown(f"<div>{book['genre']} ({book['year']})</div>", unsafe_allow_html=True)
-        
-        if st.button(f"Ver detalles", key=f"btn_{book['id']}"):
-            st.session_state.current_page = 'detail'
-            st.session_state.book_info = book
-            st.rerun()
+    if st.button(f"Ver detalles", key=f"btn_{book.id}"):
+        open_book(book.id)
+        # The catalog runs as a fragment; leaving it needs a full-app rerun
+        st.rerun()
 
 # Function to show book details
 def show_book_details(book):
     # Back button
-    if st.button("← Regresar al catálogo"):
-        st.session_state.current_page = 'home'
-        st.rerun()
+    st.button("← Regresar al catálogo", on_click=close_book)
     
-    st.title(book["title"])
+    st.title(book.title)
     
     col1, col2 = st.columns([1, 2])
     
     with col1:
-        try:
-            st.image(book["cover_url"], width=250)
-        except:
-            st.write("📚 Imagen no disponible")
+        st.markdown(cover_img_html(book.cover_url, 250), unsafe_allow_html=True)
     
     with col2:
         st.subheader("Detalles del libro")
-        st.write(f"**Autor:** {book['author']}")
-        st.write(f"**Año de publicación:** {book['year']}")
-        st.write(f"**Género:** {book['genre']}")
+        st.write(f"**Autor:** {book.author}")
+        st.write(f"**Año de publicación:** {book.year}")
+        st.write(f"**Género:** {book.genre}")
         st.write("**Descripción:**")
-        st.markdown(f"<div style='background-color:#f8f9fa; padding:10px; border-radius:5px;'>{book['description']}</div>", unsafe_allow_html=True)
+        st.markdown(f"<div style='background-color:#f8f9fa; padding:10px; border-radius:5px;'>{book.description}</div>", unsafe_allow_html=True)
     
     # Try to get more information about the book online
     st.subheader("Información adicional")
@@ -236,21 +152,20 @@ def show_book_details(book):
     except:
         st.warning("No se pudo obtener información adicional.")
 
-# Main application
-st.title("📚 BiblioMóvil")
-st.write("Explora nuestra colección de libros clásicos y contemporáneos")
-
-# Show different pages based on session state
-if st.session_state.current_page == 'home':
+# Function to show the searchable catalog; typing in the search box only
+# reruns this fragment instead of the whole script
+@st.fragment
+def show_catalog():
     # Search box
     search_query = st.text_input("Buscar libro por título o autor")
     
     # Filter books based on search query
-    filtered_books = books
+    filtered_books = BOOKS
     if search_query:
-        filtered_books = [book for book in books if 
-                         search_query.lower() in book["title"].lower() or 
-                         search_query.lower() in book["author"].lower()]
+        query = search_query.lower()
+        mask = (BOOKS_DF["title_lc"].str.contains(query, regex=False) |
+                BOOKS_DF["author_lc"].str.contains(query, regex=False))
+        filtered_books = [BOOKS[i] for i in mask.to_numpy().nonzero()[0]]
     
     # Display books catalog
     st.subheader(f"Catálogo de Libros ({len(filtered_books)} resultados)")
@@ -259,11 +174,19 @@ if st.session_state.current_page == 'home':
         st.write("No se encontraron resultados para tu búsqueda.")
     
     for book in filtered_books:
-        with st.container():
-            st.markdown("<div class='book-card'>", unsafe_allow_html=True)
-            book_card(book)
-            st.markdown("</div>", unsafe_allow_html=True)
-            st.write("")
-    
-elif st.session_state.current_page == 'detail':
-    show_book_details(st.session_state.book_info)
\ No newline at end of file
+        book_card(book)
+
+# Main application
+inject_css()
+
+st.title("📚 BiblioMóvil")
+st.write("Explora nuestra colección de libros clásicos y contemporáneos")
+
+# Show different pages based on the book_id query parameter
+book_id = st.query_params.get("book_id", "")
+selected_book = BY_ID.get(int(book_id)) if book_id.isdigit() else None
+
+if selected_book is None:
+    show_catalog()
+else:
+    show_book_details(selected_book)
\ No newline at end of file
@@ -0,0 +1,40 @@
+import json
+import sys
+import pandas as pd
+from pathlib import Path
+from typing import NamedTuple
+from urllib.parse import urlsplit
+
+class Book(NamedTuple):
+    """A catalog entry; immutable and accessed by attribute."""
+    id: int
+    title: str
+    author: str
+    year: int
+    genre: str
+    description: str
+    cover_url: str
+
+# Books catalog data, authored in books.json next to this module. Living in an
+# imported module, it is loaded once per process rather than on every
+# Streamlit rerun of app.py.
+with open(Path(__file__).with_name("books.json"), encoding="utf-8") as f:
+    _CATALOG = json.load(f)
+
+# Catalog records, with repeated genre strings interned
+BOOKS = tuple(Book(**dict(record, genre=sys.intern(record["genre"]))) for record in _CATALOG)
+
+# The same catalog stored column-wise, with lowercased search columns
+BOOKS_DF = pd.DataFrame(BOOKS).assign(
+    title_lc=lambda df: df["title"].str.lower(),
+    author_lc=lambda df: df["author"].str.lower()
+)
+
+# Books keyed by lowercased title for exact lookups
+BY_TITLE = {book.title.lower(): book for book in BOOKS}
+
+# Books keyed by id, used to resolve the book_id query parameter
+BY_ID = {book.id: book for book in BOOKS}
+
+# Cover CDN origins, warmed up with preconnect hints before any cover is shown
+COVER_ORIGINS = tuple(sorted({"https://" + urlsplit(book.cover_url).netloc for book in BOOKS}))
@@ -2,6 +2,106 @@ import plotly.express as px
 import plotly.graph_objects as go
 import pandas as pd
 import numpy as np
+from functools import lru_cache
+
+# Line charts with more points than this are downsampled before rendering
+MAX_LINE_POINTS = 2000
+
+# Upper bound on the number of bars drawn by a numeric histogram
+MAX_HISTOGRAM_BINS = 100
+
+@lru_cache(maxsize=256)
+def _pretty(column):
+    """
+    Turn a column name into an axis label, e.g. 'page_views' -> 'Page Views'.
+    
+    Parameters:
+    ----------
+    column : str
+        Column name to format
+        
+    Returns:
+    -------
+    str
+        Human-readable label
+    """
+    return column.replace('_', ' ').title()
+
+def _auto_bin_count(values):
+    """
+    Compute the number of bins numpy's 'auto' rule would use, without
+    allocating the edges.
+    
+    Parameters:
+    ----------
+    values : numpy.ndarray
+        Finite values to bin
+        
+    Returns:
+    -------
+    int
+        Number of equal-width bins
+    """
+    n = values.size
+    if n == 0:
+        return 1
+    
+    span = float(np.ptp(values))
+    if span == 0:
+        return 1
+    
+    # Same widths as numpy: the smaller of Freedman-Diaconis and Sturges,
+    # or Sturges alone when the interquartile range is zero
+    sturges_width = span / (np.log2(n) + 1.0)
+    q75, q25 = np.percentile(values, [75, 25])
+    fd_width = 2.0 * (q75 - q25) * n ** (-1.0 / 3.0)
+    width = min(fd_width, sturges_width) if fd_width else sturges_width
+    
+    return int(np.ceil(span / width))
+
+def _lttb_indices(x, y, n_out):
+    """
+    Select the indices of the visually important points of a series using
+    the Largest-Triangle-Three-Buckets algorithm.
+    
+    Parameters:
+    ----------
+    x : numpy.ndarray
+        Sorted x values as floats
+    y : numpy.ndarray
+        y values as floats
+    n_out : int
+        Number of points to keep
+        
+    Returns:
+    -------
+    numpy.ndarray
+        Positions of the points to keep, in ascending order
+    """
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    
+    # The first and last points are always kept; the rest is split into buckets
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    indices = np.empty(n_out, dtype=np.int64)
+    indices[0], indices[-1] = 0, n - 1
+    
+    a = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        next_end = edges[i + 2] if i + 2 < len(edges) else n
+        avg_x = x[end:next_end].mean()
+        avg_y = y[end:next_end].mean()
+        
+        # Keep the point forming the largest triangle with the previous pick
+        # and the average of the next bucket
+        area = np.abs((x[a] - avg_x) * (y[start:end] - y[a])
+                      - (x[a] - x[start:end]) * (avg_y - y[a]))
+        a = start + int(np.argmax(area))
+        indices[i + 1] = a
+    
+    return indices
 
 def create_bar_chart(data, x_column, y_column, agg_func='sum'):
     """
@@ -24,17 +124,18 @@ def create_bar_chart(data, x_column, y_column, agg_func='sum'):
         Plotly figure object
     """
     try:
-        # Group by if necessary
-        if data[x_column].dtype == 'object' or len(data[x_column].unique()) < len(data):
-            if agg_func == 'sum':
-                grouped_data = data.groupby(x_column)[y_column].sum().reset_index()
-            elif agg_func == 'mean':
-                grouped_data = data.groupby(x_column)[y_column].mean().reset_index()
-            elif agg_func == 'count':
-                grouped_data = data.groupby(x_column)[y_column].count().reset_index()
-            else:
-                # Default to sum
-                grouped_data = data.groupby(x_column)[y_column].sum().reset_index()
+        # Group by if necessary, i.e. when x repeats; a hash-based duplicate
+        # check answers that without building the array of unique values
+        if data[x_column].dtype == 'object' or data[x_column].duplicated().any():
+            # Named reductions go straight to pandas' Cython kernels; default to sum
+            func = agg_func if agg_func in ('sum', 'mean', 'count') else 'sum'
+            
+            # Sum charts are re-ordered by total below, so skip sorting the keys
+            grouped_data = (
+                data.groupby(x_column, sort=(agg_func != 'sum'), observed=True)[y_column]
+                .agg(func)
+                .reset_index()
+            )
         else:
             grouped_data = data
         
@@ -44,21 +145,21 @@ def create_bar_chart(data, x_column, y_column, agg_func='sum'):
             x=x_column, 
             y=y_column,
             title=f"{y_column} by {x_column} ({agg_func})",
-            labels={x_column: x_column.replace('_', ' ').title(), y_column: y_column.replace('_', ' ').title()},
+            labels={x_column: _pretty(x_column), y_column: _pretty(y_column)},
             text_auto='.2s',
             height=500
         )
         
         # Update layout for better visualization
         fig.update_layout(
-            xaxis_title=x_column.replace('_', ' ').title(),
-            yaxis_title=y_column.replace('_', ' ').title(),
+            xaxis_title=_pretty(x_column),
+            yaxis_title=_pretty(y_column),
             margin=dict(l=40, r=40, t=50, b=40),
             xaxis={'categoryorder':'total descending'} if agg_func == 'sum' else None
         )
         
         # Ensure x-axis is not too crowded
-        if len(grouped_data[x_column].unique()) > 10:
+        if grouped_data[x_column].nunique() > 10:
             fig.update_layout(
                 xaxis=dict(
                     tickmode='auto',
@@ -94,6 +195,17 @@ def create_line_chart(data, x_column, y_column):
         # Sort data by x column if it's a date or number
         if pd.api.types.is_numeric_dtype(data[x_column]) or pd.api.types.is_datetime64_any_dtype(data[x_column]):
             data = data.sort_values(by=x_column)
+            
+            # Downsample long numeric series so only the visually important
+            # points are sent to the browser
+            if len(data) > MAX_LINE_POINTS and pd.api.types.is_numeric_dtype(data[y_column]):
+                data = data.dropna(subset=[x_column, y_column])
+                if pd.api.types.is_datetime64_any_dtype(data[x_column]):
+                    x_values = data[x_column].astype('int64').to_numpy(dtype=float)
+                else:
+                    x_values = data[x_column].to_numpy(dtype=float)
+                keep = _lttb_indices(x_values, data[y_column].to_numpy(dtype=float), MAX_LINE_POINTS)
+                data = data.iloc[keep]
         
         # Create line chart
         fig = px.line(
@@ -101,7 +213,7 @@ def create_line_chart(data, x_column, y_column):
             x=x_column,
             y=y_column,
             title=f"{y_column} over {x_column}",
-            labels={x_column: x_column.replace('_', ' ').title(), y_column: y_column.replace('_', ' ').title()},
+            labels={x_column: _pretty(x_column), y_column: _pretty(y_column)},
             height=500
         )
         
@@ -110,8 +222,8 @@ def create_line_chart(data, x_column, y_column):
         
         # Update layout for better visualization
         fig.update_layout(
-            xaxis_title=x_column.replace('_', ' ').title(),
-            yaxis_title=y_column.replace('_', ' ').title(),
+            xaxis_title=_pretty(x_column),
+            yaxis_title=_pretty(y_column),
             margin=dict(l=40, r=40, t=50, b=40)
         )
         
@@ -156,31 +268,36 @@ def create_scatter_plot(data, x_column, y_column, color_column=None):
             color=color_column,
             title=f"{y_column} vs {x_column}" + (f" by {color_column}" if color_column else ""),
             labels={
-                x_column: x_column.replace('_', ' ').title(), 
-                y_column: y_column.replace('_', ' ').title(),
-                color_column: color_column.replace('_', ' ').title() if color_column else None
+                x_column: _pretty(x_column), 
+                y_column: _pretty(y_column),
+                color_column: _pretty(color_column) if color_column else None
             },
             height=500
         )
         
         # Update layout for better visualization
         fig.update_layout(
-            xaxis_title=x_column.replace('_', ' ').title(),
-            yaxis_title=y_column.replace('_', ' ').title(),
+            xaxis_title=_pretty(x_column),
+            yaxis_title=_pretty(y_column),
             margin=dict(l=40, r=40, t=50, b=40)
         )
         
         # Add trendline
         if not color_column and data[x_column].nunique() > 5 and data[y_column].nunique() > 5:
+            # Fit the least-squares line once and evaluate it at both ends
+            coeffs = np.polyfit(data[x_column].to_numpy(), data[y_column].to_numpy(), 1)
+            x0, x1 = data[x_column].min(), data[x_column].max()
+            y0, y1 = np.polyval(coeffs, [x0, x1])
+            
             fig.update_layout(
                 shapes=[dict(
                     type='line',
                     xref='x',
                     yref='y',
-                    x0=data[x_column].min(),
-                    y0=np.polyval(np.polyfit(data[x_column], data[y_column], 1), data[x_column].min()),
-                    x1=data[x_column].max(),
-                    y1=np.polyval(np.polyfit(data[x_column], data[y_column], 1), data[x_column].max()),
+                    x0=x0,
+                    y0=y0,
+                    x1=x1,
+                    y1=y1,
                     line=dict(
                         color='red',
                         width=2,
@@ -196,7 +313,7 @@ def create_scatter_plot(data, x_column, y_column, color_column=None):
 
 def create_histogram(data, column):
     """
-    Create a histogram using Plotly Express.
+    Create a histogram, binning the values on the server.
     
     Parameters:
     ----------
@@ -211,18 +328,41 @@ def create_histogram(data, column):
         Plotly figure object
     """
     try:
-        # Create histogram
-        fig = px.histogram(
-            data,
-            x=column,
-            title=f"Distribution of {column}",
-            labels={column: column.replace('_', ' ').title()},
-            height=500
-        )
+        values = data[column].dropna()
+        
+        if pd.api.types.is_numeric_dtype(values) and not pd.api.types.is_bool_dtype(values):
+            # Bin numeric values here so only the bar heights reach the browser;
+            # infinite values have no bin and would make the bin width NaN
+            array = values.to_numpy(dtype=float)
+            array = array[np.isfinite(array)]
+            
+            if array.size == 0:
+                # Nothing left to bin, so draw an empty chart
+                fig = go.Figure(go.Bar(x=[], y=[]))
+            else:
+                # Cap the 'auto' bin count before any histogram or edge array is
+                # built, since heavy-tailed data can ask for millions of bins
+                counts, edges = np.histogram(array, bins=min(_auto_bin_count(array), MAX_HISTOGRAM_BINS))
+                fig = go.Figure(go.Bar(
+                    x=(edges[:-1] + edges[1:]) / 2,
+                    y=counts,
+                    width=np.diff(edges),
+                    customdata=np.column_stack((edges[:-1], edges[1:])),
+                    hovertemplate="%{customdata[0]:.4g} - %{customdata[1]:.4g}<br>Count: %{y}<extra></extra>"
+                ))
+        elif pd.api.types.is_datetime64_any_dtype(values):
+            # Let Plotly pick calendar-aware bins for dates
+            fig = px.histogram(data, x=column)
+        else:
+            # One bar per category
+            value_counts = values.value_counts()
+            fig = go.Figure(go.Bar(x=value_counts.index, y=value_counts.to_numpy()))
+        
+        fig.update_layout(title=f"Distribution of {column}", height=500)
         
         # Update layout for better visualization
         fig.update_layout(
-            xaxis_title=column.replace('_', ' ').title(),
+            xaxis_title=_pretty(column),
             yaxis_title="Count",
             margin=dict(l=40, r=40, t=50, b=40),
             bargap=0.1
@@ -250,17 +390,25 @@ def create_pie_chart(data, column):
         Plotly figure object
     """
     try:
-        # Count values in the column
-        value_counts = data[column].value_counts().reset_index()
-        value_counts.columns = ['value', 'count']
+        # Count values in the column (sorted by count, descending)
+        value_counts = data[column].value_counts()
+        title = f"Distribution of {column}"
+        
+        # If there are too many categories, keep the top 10 and group the rest as "Other"
+        if len(value_counts) > 10:
+            value_counts = pd.concat([
+                value_counts.iloc[:10],
+                pd.Series({'Other': value_counts.iloc[10:].sum()})
+            ])
+            title = f"Distribution of {column} (Top 10 + Other)"
         
         # Create pie chart
         fig = px.pie(
-            value_counts,
+            value_counts.rename_axis('value').reset_index(name='count'),
             values='count',
             names='value',
-            title=f"Distribution of {column}",
-            labels={'value': column.replace('_', ' ').title(), 'count': 'Count'},
+            title=title,
+            labels={'value': _pretty(column), 'count': 'Count'},
             height=500
         )
         
@@ -269,25 +417,6 @@ def create_pie_chart(data, column):
             margin=dict(l=40, r=40, t=50, b=40)
         )
         
-        # If there are too many categories, limit to top N
-        if len(value_counts) > 10:
-            top_n = value_counts.nlargest(10, 'count')
-            other_count = value_counts[~value_counts['value'].isin(top_n['value'])]['count'].sum()
-            
-            top_n = pd.concat([
-                top_n,
-                pd.DataFrame([{'value': 'Other', 'count': other_count}])
-            ])
-            
-            fig = px.pie(
-                top_n,
-                values='count',
-                names='value',
-                title=f"Distribution of {column} (Top 10 + Other)",
-                labels={'value': column.replace('_', ' ').title(), 'count': 'Count'},
-                height=500
-            )
-        
         return fig
     except Exception as e:
         print(f"Error creating pie chart: {str(e)}")
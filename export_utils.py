@@ -1,6 +1,13 @@
 import pandas as pd
 import json
-import io
+import html
+
+# DataFrameFormatter is private pandas API; if it moves, every table goes
+# through DataFrame.to_html instead of the direct writer below
+try:
+    from pandas.io.formats.format import DataFrameFormatter
+except ImportError:
+    DataFrameFormatter = None
 
 def export_to_csv(data, include_index=False):
     """
@@ -19,16 +26,9 @@ def export_to_csv(data, include_index=False):
         CSV data as string
     """
     try:
-        # Create an in-memory buffer
-        buffer = io.StringIO()
-        
-        # Write DataFrame to CSV
-        data.to_csv(buffer, index=include_index)
-        
-        # Get the CSV content as a string
-        csv_data = buffer.getvalue()
-        
-        return csv_data
+        # Without a target, pandas returns the CSV text directly, avoiding an
+        # intermediate buffer and the extra copy made by getvalue()
+        return data.to_csv(index=include_index)
     except Exception as e:
         raise Exception(f"Failed to export to CSV: {str(e)}")
 
@@ -36,6 +36,11 @@ def export_to_json(data, pretty_print=True):
     """
     Export data to JSON format.
     
+    DataFrames are written by DataFrame.to_json, so their output differs
+    from json.dumps: timestamps are ISO 8601, missing values are null,
+    "/" is escaped as "\\/" and there is no space after ":" or ",".
+    Column names must be unique.
+    
     Parameters:
     ----------
     data : dict, list, or pandas.DataFrame
@@ -49,9 +54,20 @@ def export_to_json(data, pretty_print=True):
         JSON data as string
     """
     try:
-        # Convert DataFrame to dictionary if needed
+        # Serialize DataFrames with pandas' C JSON writer instead of
+        # materializing a list of dictionaries first
         if isinstance(data, pd.DataFrame):
-            data = data.to_dict(orient="records")
+            # Records need one key per column; to_json rejects repeated names
+            if not data.columns.is_unique:
+                duplicated = data.columns[data.columns.duplicated()].unique()
+                raise ValueError(f"Duplicate column names: {', '.join(map(str, duplicated))}")
+            
+            return data.to_json(
+                orient="records",
+                indent=4 if pretty_print else None,
+                date_format="iso",
+                default_handler=str
+            )
         
         # Convert to JSON string
         if pretty_print:
@@ -63,6 +79,46 @@ def export_to_json(data, pretty_print=True):
     except Exception as e:
         raise Exception(f"Failed to export to JSON: {str(e)}")
 
+# Tables larger than this are written directly instead of via DataFrame.to_html
+FAST_HTML_TABLE_ROWS = 10_000
+
+def _write_html_table(data, classes):
+    """
+    Write a DataFrame as an HTML table without pandas' HTML writer.
+    
+    Parameters:
+    ----------
+    data : pandas.DataFrame
+        Data to convert
+    classes : list
+        CSS classes added after to_html's own "dataframe" class
+        
+    Returns:
+    -------
+    str
+        HTML table as string, laid out like DataFrame.to_html's
+    """
+    # Format each column with the same formatter to_html uses, so floats,
+    # missing values, dates and categories look the same at any table size
+    formatter = DataFrameFormatter(data, index=False)
+    columns = [formatter.format_col(i) for i in range(len(data.columns))]
+    
+    # to_html escapes only &, < and > and strips the column padding
+    header = ''.join(f'      <th>{html.escape(str(column), quote=False)}</th>\n' for column in data.columns)
+    rows = ''.join(
+        '    <tr>\n'
+        + ''.join(f'      <td>{html.escape(cell.strip(), quote=False)}</td>\n' for cell in row)
+        + '    </tr>\n'
+        for row in zip(*columns)
+    )
+    
+    return (
+        f'<table border="1" class="{" ".join(["dataframe", *classes])}">\n'
+        f'  <thead>\n    <tr style="text-align: right;">\n{header}    </tr>\n  </thead>\n'
+        f'  <tbody>\n{rows}  </tbody>\n'
+        f'</table>'
+    )
+
 def convert_dataframe_to_html_table(data, max_rows=None):
     """
     Convert DataFrame to an HTML table.
@@ -80,14 +136,20 @@ def convert_dataframe_to_html_table(data, max_rows=None):
         HTML table as string
     """
     try:
-        # Limit rows if specified
+        # Limit rows if specified, before any cell is converted to text
         if max_rows is not None and len(data) > max_rows:
-            limited_data = data.head(max_rows)
+            limited_data = data.iloc[:max_rows]
         else:
             limited_data = data
         
-        # Convert to HTML
-        html_table = limited_data.to_html(classes=["dataframe", "table", "table-striped", "table-hover"], index=False)
+        # to_html always adds its own "dataframe" class in front of these
+        classes = ["table", "table-striped", "table-hover"]
+        
+        # Convert to HTML; large tables skip to_html's per-cell writer
+        if DataFrameFormatter is not None and len(limited_data) > FAST_HTML_TABLE_ROWS:
+            html_table = _write_html_table(limited_data, classes)
+        else:
+            html_table = limited_data.to_html(classes=classes, index=False)
         
         return html_table
     except Exception as e:
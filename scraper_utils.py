@@ -1,10 +1,80 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import streamlit as st
 from bs4 import BeautifulSoup
+import soupsieve
 import trafilatura
 import pandas as pd
 import time
 import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import zip_longest
 
+# Shared session so repeated requests reuse pooled keep-alive connections
+_SESSION = requests.Session()
+_SESSION.headers.update({
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+})
+
+# Keep a pool of connections per host and retry transient failures with backoff
+_ADAPTER = HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=10,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=(429, 500, 502, 503, 504))
+)
+_SESSION.mount('https://', _ADAPTER)
+_SESSION.mount('http://', _ADAPTER)
+
+# How long scraped results are reused before the page is fetched again
+SCRAPE_CACHE_TTL = 3600
+
+# Seconds to wait for a server to connect or send data before giving up
+REQUEST_TIMEOUT = 15
+
+# Patterns compiled once at import instead of on every call
+_NEWLINE_RE = re.compile(r'\n+')
+_SPACE_RE = re.compile(r' +')
+_DOMAIN_RE = re.compile(r'(https?://[^/]+)')
+
+@lru_cache(maxsize=256)
+def _compile_selector(selector):
+    """
+    Compile a CSS selector once so it can be matched against many pages.
+    
+    Parameters:
+    ----------
+    selector : str
+        CSS selector to compile
+        
+    Returns:
+    -------
+    soupsieve.SoupSieve
+        Compiled selector with `select` and `select_one` methods
+    """
+    return soupsieve.compile(selector)
+
+def _parse_html(response):
+    """
+    Parse the raw bytes of a response without decoding them in Python first.
+    
+    Parameters:
+    ----------
+    response : requests.Response
+        Successful response holding an HTML page
+        
+    Returns:
+    -------
+    bs4.BeautifulSoup
+        Parsed HTML of the page
+    """
+    # Only trust the encoding when the server declared one; otherwise requests
+    # falls back to ISO-8859-1 and the page's own <meta charset> should win
+    declared = 'charset' in response.headers.get('Content-Type', '').lower()
+    return BeautifulSoup(response.content, 'lxml', from_encoding=response.encoding if declared else None)
+
+@st.cache_data(ttl=SCRAPE_CACHE_TTL, show_spinner=False)
 def scrape_website(url):
     """
     Scrape the full content of a website using Trafilatura.
@@ -18,27 +88,28 @@ def scrape_website(url):
     -------
     str
         The main text content of the website
+        
+    Notes:
+    -----
+    Results are cached per URL for SCRAPE_CACHE_TTL seconds; call
+    `scrape_website.clear()` to force a fresh download.
     """
     try:
         # Send a request to the website
         downloaded = trafilatura.fetch_url(url)
         if downloaded is None:
             # Fallback to requests if trafilatura fails
-            response = requests.get(url, headers={
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-            })
+            response = _SESSION.get(url, timeout=REQUEST_TIMEOUT)
             response.raise_for_status()
-            text = trafilatura.extract(response.text)
+            text = trafilatura.extract(response.content)
         else:
             text = trafilatura.extract(downloaded)
             
         if text is None:
             # If trafilatura extraction fails, use BeautifulSoup as fallback
-            response = requests.get(url, headers={
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-            })
+            response = _SESSION.get(url, timeout=REQUEST_TIMEOUT)
             response.raise_for_status()
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = _parse_html(response)
             
             # Remove script and style elements
             for script in soup(["script", "style"]):
@@ -48,14 +119,130 @@ def scrape_website(url):
             text = soup.get_text(separator='\n')
             
             # Clean up text: remove multiple newlines and whitespace
-            text = re.sub(r'\n+', '\n', text)
-            text = re.sub(r' +', ' ', text)
+            text = _NEWLINE_RE.sub('\n', text)
+            text = _SPACE_RE.sub(' ', text)
             text = text.strip()
             
         return text
     except Exception as e:
         raise Exception(f"Failed to scrape website: {str(e)}")
 
+def _fetch_page(url, delay=0):
+    """
+    Download and parse a page, optionally waiting first to avoid
+    overloading the server.
+    
+    Parameters:
+    ----------
+    url : str
+        URL of the page to download
+    delay : float, optional
+        Seconds to wait before sending the request
+        
+    Returns:
+    -------
+    bs4.BeautifulSoup
+        Parsed HTML of the page
+    """
+    if delay:
+        time.sleep(delay)
+    
+    response = _SESSION.get(url, timeout=REQUEST_TIMEOUT)
+    response.raise_for_status()
+    return _parse_html(response)
+
+def _next_page_url(soup, selector, current_url):
+    """
+    Resolve the URL of the next page from a pagination link.
+    
+    Parameters:
+    ----------
+    soup : bs4.BeautifulSoup
+        Parsed HTML of the current page
+    selector : str
+        CSS selector for the next page link
+    current_url : str
+        URL of the current page, used to resolve relative links
+        
+    Returns:
+    -------
+    str or None
+        Absolute URL of the next page, or None if there is no next page
+    """
+    next_button = _compile_selector(selector).select_one(soup)
+    if not next_button or not next_button.get('href'):
+        return None
+    
+    # Get the next page URL
+    next_url = next_button['href']
+    
+    # Handle relative URLs
+    if not next_url.startswith('http'):
+        if next_url.startswith('/'):
+            # Absolute path relative to domain
+            base_url = _DOMAIN_RE.match(current_url).group(1)
+            next_url = base_url + next_url
+        else:
+            # Relative path to current URL
+            current_url_base = current_url.rsplit('/', 1)[0]
+            next_url = f"{current_url_base}/{next_url}"
+    
+    return next_url
+
+@lru_cache(maxsize=64)
+def _make_extractor(selector_items, attribute_name=None):
+    """
+    Build a page extractor specialised for a fixed set of selectors.
+    
+    Parameters:
+    ----------
+    selector_items : tuple
+        (field name, CSS selector) pairs, in output order
+    attribute_name : str, optional
+        Name of the attribute to extract instead of text (e.g., 'href', 'src')
+        
+    Returns:
+    -------
+    callable
+        Function taking a parsed page and returning the list of non-empty
+        items found on it
+    """
+    field_names = tuple(field_name for field_name, _ in selector_items)
+    compiled_selectors = tuple(_compile_selector(selector) for _, selector in selector_items)
+    
+    # Pick the value getter once instead of testing attribute_name per element
+    if attribute_name:
+        def value_of(element):
+            return element.get(attribute_name, '') if element is not None else ''
+    else:
+        def value_of(element):
+            return element.get_text(strip=True) if element is not None else ''
+    
+    def extract_items(soup):
+        # Run every selector once per page and reuse the matches for all items
+        matches = [compiled.select(soup) for compiled in compiled_selectors]
+        
+        # Check if we're extracting multiple items (list) or single items
+        # If the first selector returns multiple elements, we'll treat it as a list extraction
+        if len(matches[0]) > 1:
+            # Walk the matches row by row, padding shorter fields with None
+            rows = zip_longest(*matches)
+        else:
+            # Single item extraction
+            rows = [tuple(elements[0] if elements else None for elements in matches)]
+        
+        items = []
+        for row_elements in rows:
+            item_data = dict(zip(field_names, map(value_of, row_elements)))
+            
+            # Only add non-empty items
+            if any(item_data.values()):
+                items.append(item_data)
+        return items
+    
+    return extract_items
+
+@st.cache_data(ttl=SCRAPE_CACHE_TTL, show_spinner=False)
 def extract_data_with_selectors(url, selectors, attribute_name=None, pagination_config=None):
     """
     Extract data from a website using CSS selectors.
@@ -78,104 +265,49 @@ def extract_data_with_selectors(url, selectors, attribute_name=None, pagination_
     -------
     list
         List of dictionaries containing the extracted data
+        
+    Notes:
+    -----
+    Results are cached per combination of arguments for SCRAPE_CACHE_TTL
+    seconds; call `extract_data_with_selectors.clear()` to force a fresh
+    download.
     """
     try:
         results = []
         current_url = url
         page_count = 0
         max_pages = 1  # Default to 1 page if pagination not enabled
+        paginate = bool(pagination_config and pagination_config.get('enabled', False))
         
-        if pagination_config and pagination_config.get('enabled', False):
+        if paginate:
             max_pages = pagination_config.get('max_pages', 1)
         
-        while page_count < max_pages:
-            # Send a request to the current page
-            response = requests.get(current_url, headers={
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-            })
-            response.raise_for_status()
-            
-            # Parse the HTML
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # Check if we're extracting multiple items (list) or single items
-            # If any selector returns multiple elements, we'll treat it as a list extraction
-            is_list_extraction = False
-            sample_selector = list(selectors.values())[0]
-            if len(soup.select(sample_selector)) > 1:
-                is_list_extraction = True
+        # Build the extractor once; its compiled selectors are reused on every page
+        extract_items = _make_extractor(tuple(selectors.items()), attribute_name)
+        
+        # A single background worker downloads and parses the next page
+        # while the current one is being extracted. Only the download of
+        # page N+1 overlaps the extraction of page N: parsing holds the GIL,
+        # so it takes turns with the extraction rather than running alongside
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            pending = executor.submit(_fetch_page, current_url)
             
-            if is_list_extraction:
-                # Get the maximum number of items for any selector
-                max_items = max([len(soup.select(selector)) for selector in selectors.values()])
+            while pending is not None:
+                # Wait for the page the worker has fetched and parsed
+                soup = pending.result()
+                page_count += 1
+                pending = None
                 
-                # Extract data for each item
-                for i in range(max_items):
-                    item_data = {}
-                    for field_name, selector in selectors.items():
-                        elements = soup.select(selector)
-                        if i < len(elements):
-                            if attribute_name:
-                                # Extract attribute value
-                                item_data[field_name] = elements[i].get(attribute_name, '')
-                            else:
-                                # Extract text
-                                item_data[field_name] = elements[i].get_text(strip=True)
-                        else:
-                            item_data[field_name] = ''
-                    
-                    # Only add non-empty items
-                    if any(item_data.values()):
-                        results.append(item_data)
-            else:
-                # Single item extraction
-                item_data = {}
-                for field_name, selector in selectors.items():
-                    elements = soup.select(selector)
-                    if elements:
-                        if attribute_name:
-                            # Extract attribute value
-                            item_data[field_name] = elements[0].get(attribute_name, '')
-                        else:
-                            # Extract text
-                            item_data[field_name] = elements[0].get_text(strip=True)
-                    else:
-                        item_data[field_name] = ''
+                # Start fetching the next page, if any, before extracting this one
+                if paginate and page_count < max_pages:
+                    next_url = _next_page_url(soup, pagination_config.get('selector', ''), current_url)
+                    if next_url:
+                        # Add a small delay to avoid overloading the server
+                        pending = executor.submit(_fetch_page, next_url, 1)
+                        current_url = next_url
                 
-                # Only add non-empty items
-                if any(item_data.values()):
-                    results.append(item_data)
-            
-            page_count += 1
-            
-            # Check if pagination is enabled and there's a next page
-            if pagination_config and pagination_config.get('enabled', False):
-                next_button = soup.select_one(pagination_config.get('selector', ''))
-                if next_button and next_button.get('href'):
-                    # Get the next page URL
-                    next_url = next_button['href']
-                    
-                    # Handle relative URLs
-                    if not next_url.startswith('http'):
-                        if next_url.startswith('/'):
-                            # Absolute path relative to domain
-                            base_url = re.match(r'(https?://[^/]+)', current_url).group(1)
-                            next_url = base_url + next_url
-                        else:
-                            # Relative path to current URL
-                            current_url_base = current_url.rsplit('/', 1)[0]
-                            next_url = f"{current_url_base}/{next_url}"
-                    
-                    current_url = next_url
-                    
-                    # Add a small delay to avoid overloading the server
-                    time.sleep(1)
-                else:
-                    # No next page found, break the loop
-                    break
-            else:
-                # Pagination not enabled, break after first page
-                break
+                # Extract the items of this page with the specialised extractor
+                results.extend(extract_items(soup))
         
         return results
     except Exception as e:
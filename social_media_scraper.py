@@ -1,11 +1,246 @@
-import pandas as pd
-import datetime
+import functools
+import hashlib
+import inspect
+import json
 import os
 import re
-import tempfile
 import subprocess
+import tempfile
+import threading
+import time
+
+# orjson is an optional, much faster parser; fall back to json without it
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+# Column order and dtypes of the DataFrame returned by scrape_twitter
+TWEET_COLUMNS = ['date', 'id', 'content', 'user', 'retweet_count', 'like_count',
+                 'reply_count', 'language', 'source', 'url']
+TWEET_DTYPES = {'id': 'int64', 'retweet_count': 'int32', 'like_count': 'int32', 'reply_count': 'int32'}
+
+# Text columns are stored as Arrow strings, and repetitive ones as categories
+TWEET_TEXT_DTYPES = {
+    'content': 'string[pyarrow]',
+    'user': 'string[pyarrow]',
+    'language': 'category',
+    'source': 'category',
+    'url': 'string[pyarrow]'
+}
+
+# Column order of the DataFrame returned by scrape_reddit
+REDDIT_COLUMNS = ['id', 'title', 'score', 'author', 'created_utc', 'num_comments',
+                  'url', 'selftext', 'subreddit', 'permalink']
+
+# Text columns are stored as Arrow strings, and repeated subreddit names as a category
+REDDIT_TEXT_DTYPES = {
+    'id': 'string[pyarrow]',
+    'title': 'string[pyarrow]',
+    'author': 'string[pyarrow]',
+    'url': 'string[pyarrow]',
+    'selftext': 'string[pyarrow]',
+    'subreddit': 'category',
+    'permalink': 'string[pyarrow]'
+}
+
+# Columns of the snscrape Reddit output that stand in for missing REDDIT_COLUMNS
+REDDIT_SNSCRAPE_FIELDS = {
+    'created_utc': 'date',
+    'title': 'content',
+    'author': 'username',
+    'score': 'upvoteCount',
+    'num_comments': 'commentCount',
+    'permalink': 'url'
+}
+
+# How each column is read from a scraped item, so only requested columns are built
+_TWEET_GETTERS = {
+    'date': lambda tweet: tweet.date,
+    'id': lambda tweet: tweet.id,
+    'content': lambda tweet: tweet.rawContent,
+    'user': lambda tweet: tweet.user.username,
+    'retweet_count': lambda tweet: tweet.retweetCount,
+    'like_count': lambda tweet: tweet.likeCount,
+    'reply_count': lambda tweet: tweet.replyCount,
+    'language': lambda tweet: tweet.lang,
+    'source': lambda tweet: getattr(tweet, 'sourceLabel', ''),
+    'url': lambda tweet: tweet.url
+}
+_TWEET_RECORD_GETTERS = {
+    'date': lambda record: record.get('date'),
+    'id': lambda record: record.get('id'),
+    'content': lambda record: record.get('rawContent', record.get('content')),
+    'user': lambda record: _record_username(record),
+    'retweet_count': lambda record: record.get('retweetCount') or 0,
+    'like_count': lambda record: record.get('likeCount') or 0,
+    'reply_count': lambda record: record.get('replyCount') or 0,
+    'language': lambda record: record.get('lang'),
+    'source': lambda record: record.get('sourceLabel', ''),
+    'url': lambda record: record.get('url')
+}
+_POST_GETTERS = {
+    'id': lambda post: post.id,
+    'title': lambda post: post.title,
+    'score': lambda post: post.score,
+    'author': lambda post: str(post.author),
+    'created_utc': lambda post: post.created_utc,
+    'num_comments': lambda post: post.num_comments,
+    'url': lambda post: post.url,
+    'selftext': lambda post: post.selftext,
+    'subreddit': lambda post: post.subreddit.display_name,
+    'permalink': lambda post: post.permalink
+}
+
+# Scraped DataFrames are kept on disk as Parquet files for this many seconds
+SCRAPE_CACHE_DIR = os.getenv("SCRAPE_CACHE_DIR", ".scrape_cache")
+SCRAPE_CACHE_TTL = 3600
+
+def _disk_cached(columns, text_dtypes):
+    """
+    Cache the DataFrames returned by a scraper on disk, keyed by its arguments.
+    
+    The decorated function takes a keyword-only `fields` argument, which is
+    checked against `columns` before anything is fetched, and an extra
+    `use_cache` keyword argument (default True); pass `use_cache=False` to
+    always scrape afresh. Only the requested columns are scraped and cached,
+    so each selection of fields has its own entry.
+    
+    Parameters:
+    ----------
+    columns : list
+        Every column the scraper can return
+    text_dtypes : dict
+        Text dtypes of the scraped frame, which Parquet reads back as
+        string[python] and are cast again on a cache hit
+        
+    Returns:
+    -------
+    callable
+        Decorator wrapping a scraper that returns a pandas.DataFrame
+    """
+    def decorator(scrape_func):
+        signature = inspect.signature(scrape_func)
+        
+        @functools.wraps(scrape_func)
+        def wrapper(*args, fields=None, use_cache=True, **kwargs):
+            # Binding first rejects fields passed positionally, and unknown
+            # columns are rejected before any network request is made
+            bound = signature.bind(*args, fields=fields, **kwargs)
+            fields = _check_fields(fields, columns)
+            
+            if not use_cache:
+                return scrape_func(*args, fields=fields, **kwargs)
+            
+            # Bind defaults so scrape('q') and scrape('q', 100) share an entry,
+            # and key on the checked fields so fields=None and every column do too
+            bound.apply_defaults()
+            bound.arguments['fields'] = tuple(fields)
+            key = hashlib.sha1(repr((scrape_func.__name__, tuple(bound.arguments.items()))).encode()).hexdigest()
+            path = os.path.join(SCRAPE_CACHE_DIR, f"{key}.parquet")
+            
+            try:
+                if time.time() - os.path.getmtime(path) < SCRAPE_CACHE_TTL:
+                    import pandas as pd
+                    return _astype_present(pd.read_parquet(path, columns=fields), text_dtypes)
+                
+                # Delete expired entries so the cache directory does not grow forever
+                os.remove(path)
+            except Exception:
+                # Missing or unreadable entries are simply scraped again
+                pass
+            
+            result = scrape_func(*args, fields=fields, **kwargs)
+            
+            # Write to a unique temporary file first, so concurrent sessions never
+            # share a partial entry and readers only ever see complete files
+            tmp_path = None
+            try:
+                os.makedirs(SCRAPE_CACHE_DIR, exist_ok=True)
+                fd, tmp_path = tempfile.mkstemp(dir=SCRAPE_CACHE_DIR, suffix='.tmp')
+                os.close(fd)
+                result.to_parquet(tmp_path, index=False)
+                os.replace(tmp_path, path)
+            except Exception:
+                # Results Parquet cannot store (e.g. mixed nested objects) are not cached
+                if tmp_path is not None and os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+            
+            return result
+        
+        return wrapper
+    
+    return decorator
+
+def _check_fields(fields, columns):
+    """
+    Validate the columns requested from a scraper.
+    
+    Parameters:
+    ----------
+    fields : list or None
+        Requested columns, in order; None requests every column
+    columns : list
+        Every column the scraper can return
+        
+    Returns:
+    -------
+    list
+        The requested columns
+    """
+    if fields is None:
+        return list(columns)
+    
+    unknown = [field for field in fields if field not in columns]
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(unknown)}")
+    
+    return list(fields)
+
+def _astype_present(data, dtypes):
+    """
+    Cast the columns of a DataFrame that appear in a dtype mapping.
+    
+    Parameters:
+    ----------
+    data : pandas.DataFrame
+        Scraped data, possibly holding only some of the columns
+    dtypes : dict
+        Target dtype per column name
+        
+    Returns:
+    -------
+    pandas.DataFrame
+        DataFrame with the present columns cast
+    """
+    return data.astype({column: dtype for column, dtype in dtypes.items() if column in data.columns})
+
+def _normalize_tweets(data):
+    """
+    Give scraped tweets the same dtypes whichever back end produced them.
+    
+    Parameters:
+    ----------
+    data : pandas.DataFrame
+        Tweets holding some or all of TWEET_COLUMNS
+        
+    Returns:
+    -------
+    pandas.DataFrame
+        Tweets with TWEET_DTYPES, datetime dates and TWEET_TEXT_DTYPES applied
+    """
+    import pandas as pd
+    
+    data = _astype_present(data, TWEET_DTYPES)
+    if 'date' in data.columns:
+        data['date'] = pd.to_datetime(data['date'])
+    
+    return _astype_present(data, TWEET_TEXT_DTYPES)
 
-def scrape_twitter(query, limit=100):
+@_disk_cached(TWEET_COLUMNS, TWEET_TEXT_DTYPES)
+def scrape_twitter(query, limit=100, *, fields=None):
     """
     Scrape tweets using SNScrape.
     
@@ -15,45 +250,116 @@ def scrape_twitter(query, limit=100):
         Twitter search query
     limit : int, optional
         Maximum number of tweets to scrape
+    fields : list, optional
+        Columns of TWEET_COLUMNS to return; all of them by default.
+        Only these columns are scraped
+    use_cache : bool, optional
+        Reuse a result cached on disk within the last SCRAPE_CACHE_TTL seconds
         
     Returns:
     -------
     pandas.DataFrame
         DataFrame containing tweet data
     """
+    import pandas as pd
+    
+    fields = TWEET_COLUMNS if fields is None else fields
+    
+    # from_records returns a frame without any columns when asked for no rows
+    if limit <= 0:
+        return _normalize_tweets(pd.DataFrame(columns=fields))
+    
     try:
         import snscrape.modules.twitter as sntwitter
         
-        # List to store tweet data
-        tweets_list = []
+        getters = [_TWEET_GETTERS[field] for field in fields]
         
-        # Using SNScrape to get tweets
-        for i, tweet in enumerate(sntwitter.TwitterSearchScraper(query).get_items()):
-            if i >= limit:
-                break
-                
-            tweets_list.append({
-                'date': tweet.date,
-                'id': tweet.id,
-                'content': tweet.rawContent,
-                'user': tweet.user.username,
-                'retweet_count': tweet.retweetCount,
-                'like_count': tweet.likeCount,
-                'reply_count': tweet.replyCount,
-                'language': tweet.lang,
-                'source': tweet.sourceLabel if hasattr(tweet, 'sourceLabel') else '',
-                'url': tweet.url
-            })
+        def _iter_rows():
+            # Yield one tuple of the requested fields per tweet; pandas stops
+            # reading after `limit` rows
+            for i, tweet in enumerate(sntwitter.TwitterSearchScraper(query).get_items()):
+                if i >= limit:
+                    break
+                    
+                yield tuple(get(tweet) for get in getters)
         
-        # Create DataFrame
-        tweets_df = pd.DataFrame(tweets_list)
-        return tweets_df
+        # Create DataFrame straight from the generator
+        tweets_df = pd.DataFrame.from_records(_iter_rows(), columns=fields, nrows=limit)
         
     except ImportError:
         # Fallback to using snscrape via subprocess if the Python module is not available
-        return _scrape_twitter_subprocess(query, limit)
+        tweets_df = _scrape_twitter_subprocess(query, limit, fields)
+    
+    # Store counts as int32 rather than inferred int64, for either back end
+    return _normalize_tweets(tweets_df)
+
+def _run_snscrape(scraper_args, limit):
+    """
+    Run the snscrape command line tool and stream the records it prints.
+    
+    Parameters:
+    ----------
+    scraper_args : list
+        Scraper name followed by its arguments, e.g. ['twitter-search', query]
+    limit : int
+        Maximum number of records to scrape
+        
+    Yields:
+    ------
+    dict
+        One parsed JSON record per line of output
+    """
+    # Passing an argument list avoids the shell, so the query needs no quoting
+    command = ['snscrape', '--jsonl', '--max-results', str(limit), *scraper_args]
+    
+    with subprocess.Popen(command, stdout=subprocess.PIPE, bufsize=1 << 20) as process:
+        for line in process.stdout:
+            if line.strip():
+                yield _json_loads(line)
+    
+    if process.returncode:
+        raise subprocess.CalledProcessError(process.returncode, command)
+
+def _record_username(record):
+    """
+    Read the author's username from a tweet record printed by snscrape.
+    
+    Parameters:
+    ----------
+    record : dict
+        Parsed JSON record of one tweet
+        
+    Returns:
+    -------
+    str
+        Username of the tweet's author
+    """
+    # Keep only the username of the nested user object
+    user = record.get('user')
+    if isinstance(user, dict):
+        user = user.get('username', '')
+    
+    return record.get('username', user)
 
-def _scrape_twitter_subprocess(query, limit=100):
+def _tweet_record_to_row(record, fields):
+    """
+    Pick the requested fields out of a tweet record printed by snscrape.
+    
+    Parameters:
+    ----------
+    record : dict
+        Parsed JSON record of one tweet
+    fields : list
+        Columns of TWEET_COLUMNS to extract
+        
+    Returns:
+    -------
+    tuple
+        Field values in `fields` order
+    """
+    return tuple(_TWEET_RECORD_GETTERS[field](record) for field in fields)
+
+def _scrape_twitter_subprocess(query, limit=100, fields=TWEET_COLUMNS):
     """
     Fallback function to scrape tweets using snscrape via subprocess.
     
@@ -63,57 +369,26 @@ def _scrape_twitter_subprocess(query, limit=100):
         Twitter search query
     limit : int, optional
         Maximum number of tweets to scrape
+    fields : list, optional
+        Columns of TWEET_COLUMNS to build
         
     Returns:
     -------
     pandas.DataFrame
         DataFrame containing tweet data
     """
-    # Ensure the query is properly quoted for the command line
-    escaped_query = query.replace('"', '\\"')
-    
-    # Create a temporary file to store the JSON output
-    with tempfile.NamedTemporaryFile(delete=False, suffix='.json') as tmp_file:
-        tmp_filename = tmp_file.name
+    import pandas as pd
     
     try:
-        # Run snscrape command to get tweets
-        command = f'snscrape --jsonl --max-results {limit} twitter-search "{escaped_query}" > {tmp_filename}'
-        subprocess.run(command, shell=True, check=True)
-        
-        # Read the JSON file into a DataFrame
-        tweets_df = pd.read_json(tmp_filename, lines=True)
-        
-        # Clean up the columns to match the Python module output
-        if not tweets_df.empty:
-            tweets_df = tweets_df.rename(columns={
-                'date': 'date',
-                'id': 'id',
-                'content': 'content',
-                'username': 'user',
-                'retweetCount': 'retweet_count',
-                'likeCount': 'like_count',
-                'replyCount': 'reply_count',
-                'lang': 'language',
-                'sourceLabel': 'source',
-                'url': 'url'
-            })
-            
-            # Extract username from user object if needed
-            if 'user' in tweets_df.columns and isinstance(tweets_df['user'].iloc[0], dict):
-                tweets_df['user'] = tweets_df['user'].apply(lambda x: x.get('username', ''))
-        
-        return tweets_df
+        # Run snscrape and keep only the requested fields of each record
+        rows = (_tweet_record_to_row(record, fields) for record in _run_snscrape(['twitter-search', query], limit))
+        return pd.DataFrame.from_records(rows, columns=fields, nrows=limit)
     
     except Exception as e:
         raise Exception(f"Failed to scrape Twitter data: {str(e)}")
-    
-    finally:
-        # Clean up the temporary file
-        if os.path.exists(tmp_filename):
-            os.remove(tmp_filename)
 
-def scrape_reddit(scrape_type, query, limit=10, time_filter="all"):
+@_disk_cached(REDDIT_COLUMNS, REDDIT_TEXT_DTYPES)
+def scrape_reddit(scrape_type, query, limit=10, time_filter="all", *, fields=None):
     """
     Scrape Reddit data using PRAW or PSAW.
     
@@ -127,52 +402,59 @@ def scrape_reddit(scrape_type, query, limit=10, time_filter="all"):
         Maximum number of posts to scrape
     time_filter : str, optional
         Time filter for results: 'day', 'week', 'month', 'year', 'all'
+    fields : list, optional
+        Columns of REDDIT_COLUMNS to return; all of them by default.
+        Only these columns are scraped
+    use_cache : bool, optional
+        Reuse a result cached on disk within the last SCRAPE_CACHE_TTL seconds
         
     Returns:
     -------
     pandas.DataFrame
         DataFrame containing Reddit post data
     """
+    fields = REDDIT_COLUMNS if fields is None else fields
+    
     try:
         # First try to use PRAW if available
         try:
             import praw
-            return _scrape_reddit_praw(scrape_type, query, limit, time_filter)
+            posts_df = _scrape_reddit_praw(scrape_type, query, limit, time_filter, fields)
         except ImportError:
             # Fall back to using snscrape via subprocess
-            return _scrape_reddit_subprocess(scrape_type, query, limit, time_filter)
+            posts_df = _scrape_reddit_subprocess(scrape_type, query, limit, time_filter, fields)
+        
+        return _astype_present(posts_df, REDDIT_TEXT_DTYPES)
     
     except Exception as e:
         raise Exception(f"Failed to scrape Reddit data: {str(e)}")
 
-def _scrape_reddit_praw(scrape_type, query, limit=10, time_filter="all"):
+@functools.lru_cache(maxsize=4)
+def _get_reddit_client(client_id, client_secret, user_agent):
     """
-    Scrape Reddit data using PRAW.
+    Create a PRAW client, reusing it for later calls with the same credentials.
+    
+    Keeping the client keeps its HTTP session, and with it the pooled
+    connections and OAuth token, alive between scrapes. PRAW is not
+    thread-safe and Streamlit runs every session in its own thread, so the
+    client comes with a lock that must be held while it is being used.
     
     Parameters:
     ----------
-    scrape_type : str
-        Type of scraping: 'subreddit', 'user', or 'search'
-    query : str
-        Subreddit name, username, or search query
-    limit : int, optional
-        Maximum number of posts to scrape
-    time_filter : str, optional
-        Time filter for results: 'day', 'week', 'month', 'year', 'all'
+    client_id : str
+        Reddit API client id, or '' for read-only browsing
+    client_secret : str
+        Reddit API client secret, or '' for read-only browsing
+    user_agent : str
+        User agent sent with every request
         
     Returns:
     -------
-    pandas.DataFrame
-        DataFrame containing Reddit post data
+    tuple
+        (praw.Reddit client, threading.Lock guarding it)
     """
     import praw
     
-    # Initialize Reddit API client
-    # Try to get credentials from environment variables, use anonymous browsing if not available
-    client_id = os.getenv("REDDIT_CLIENT_ID", "")
-    client_secret = os.getenv("REDDIT_CLIENT_SECRET", "")
-    user_agent = os.getenv("REDDIT_USER_AGENT", "DataHarvest:v1.0 (by /u/DataHarvestApp)")
-    
     if client_id and client_secret:
         reddit = praw.Reddit(
             client_id=client_id,
@@ -199,67 +481,93 @@ def _scrape_reddit_praw(scrape_type, query, limit=10, time_filter="all"):
             timeout=16
         )
     
-    # List to store post data
-    posts_list = []
+    return reddit, threading.Lock()
+
+def _scrape_reddit_praw(scrape_type, query, limit=10, time_filter="all", fields=REDDIT_COLUMNS):
+    """
+    Scrape Reddit data using PRAW.
     
-    # Scrape data based on type
-    if scrape_type == "subreddit":
-        # Get posts from a subreddit
-        subreddit = reddit.subreddit(query)
+    Parameters:
+    ----------
+    scrape_type : str
+        Type of scraping: 'subreddit', 'user', or 'search'
+    query : str
+        Subreddit name, username, or search query
+    limit : int, optional
+        Maximum number of posts to scrape
+    time_filter : str, optional
+        Time filter for results: 'day', 'week', 'month', 'year', 'all'
+    fields : list, optional
+        Columns of REDDIT_COLUMNS to build
         
-        for post in subreddit.top(time_filter=time_filter, limit=limit):
-            posts_list.append({
-                'id': post.id,
-                'title': post.title,
-                'score': post.score,
-                'author': str(post.author),
-                'created_utc': datetime.datetime.fromtimestamp(post.created_utc),
-                'num_comments': post.num_comments,
-                'url': post.url,
-                'selftext': post.selftext,
-                'subreddit': post.subreddit.display_name,
-                'permalink': f"https://www.reddit.com{post.permalink}"
-            })
+    Returns:
+    -------
+    pandas.DataFrame
+        DataFrame containing Reddit post data
+    """
+    import pandas as pd
     
-    elif scrape_type == "user":
-        # Get posts from a user
-        user = reddit.redditor(query)
-        
-        for post in user.submissions.new(limit=limit):
-            posts_list.append({
-                'id': post.id,
-                'title': post.title,
-                'score': post.score,
-                'author': str(post.author),
-                'created_utc': datetime.datetime.fromtimestamp(post.created_utc),
-                'num_comments': post.num_comments,
-                'url': post.url,
-                'selftext': post.selftext,
-                'subreddit': post.subreddit.display_name,
-                'permalink': f"https://www.reddit.com{post.permalink}"
-            })
+    # Initialize Reddit API client
+    # Try to get credentials from environment variables, use anonymous browsing if not available
+    client_id = os.getenv("REDDIT_CLIENT_ID", "")
+    client_secret = os.getenv("REDDIT_CLIENT_SECRET", "")
+    user_agent = os.getenv("REDDIT_USER_AGENT", "DataHarvest:v1.0 (by /u/DataHarvestApp)")
     
-    elif scrape_type == "search":
-        # Search for posts
-        for post in reddit.subreddit("all").search(query, time_filter=time_filter, limit=limit):
-            posts_list.append({
-                'id': post.id,
-                'title': post.title,
-                'score': post.score,
-                'author': str(post.author),
-                'created_utc': datetime.datetime.fromtimestamp(post.created_utc),
-                'num_comments': post.num_comments,
-                'url': post.url,
-                'selftext': post.selftext,
-                'subreddit': post.subreddit.display_name,
-                'permalink': f"https://www.reddit.com{post.permalink}"
-            })
+    reddit, reddit_lock = _get_reddit_client(client_id, client_secret, user_agent)
+    
+    # Only one thread at a time may use the shared client; the listing is
+    # fetched lazily, so the lock is held until every post has been read
+    with reddit_lock:
+        # Pick the listing to read based on type
+        if scrape_type == "subreddit":
+            # Get posts from a subreddit
+            posts = reddit.subreddit(query).top(time_filter=time_filter, limit=limit)
+        
+        elif scrape_type == "user":
+            # Get posts from a user
+            posts = reddit.redditor(query).submissions.new(limit=limit)
+        
+        elif scrape_type == "search":
+            # Search for posts
+            posts = reddit.subreddit("all").search(query, time_filter=time_filter, limit=limit)
+        
+        else:
+            posts = []
+        
+        # List to store post data
+        posts_list = [_post_to_dict(post, fields) for post in posts]
     
     # Create DataFrame
-    posts_df = pd.DataFrame(posts_list)
+    posts_df = pd.DataFrame(posts_list, columns=fields)
+    
+    # Convert the epoch seconds of the whole column at once
+    if 'created_utc' in posts_df.columns:
+        posts_df['created_utc'] = pd.to_datetime(posts_df['created_utc'], unit='s', utc=True)
+    
+    # Turn the relative permalinks into full URLs in one Arrow string kernel
+    if 'permalink' in posts_df.columns:
+        posts_df['permalink'] = "https://www.reddit.com" + posts_df['permalink'].astype('string[pyarrow]')
     return posts_df
 
-def _scrape_reddit_subprocess(scrape_type, query, limit=10, time_filter="all"):
+def _post_to_dict(post, fields=REDDIT_COLUMNS):
+    """
+    Convert a PRAW submission into a row of the Reddit DataFrame.
+    
+    Parameters:
+    ----------
+    post : praw.models.Submission
+        Submission returned by a PRAW listing
+    fields : list, optional
+        Columns of REDDIT_COLUMNS to extract
+        
+    Returns:
+    -------
+    dict
+        Post data keyed by column name
+    """
+    return {field: _POST_GETTERS[field](post) for field in fields}
+
+def _scrape_reddit_subprocess(scrape_type, query, limit=10, time_filter="all", fields=REDDIT_COLUMNS):
     """
     Fallback function to scrape Reddit using snscrape via subprocess.
     
@@ -273,61 +581,51 @@ def _scrape_reddit_subprocess(scrape_type, query, limit=10, time_filter="all"):
         Maximum number of posts to scrape
     time_filter : str, optional
         Time filter for results: 'day', 'week', 'month', 'year', 'all'
+    fields : list, optional
+        Columns of REDDIT_COLUMNS to build
         
     Returns:
     -------
     pandas.DataFrame
         DataFrame containing Reddit post data
     """
+    import pandas as pd
+    
     # Create a command based on the scrape type
     if scrape_type == "subreddit":
-        snscrape_query = f"reddit-subreddit {query}"
+        scraper_args = ['reddit-subreddit', query]
     elif scrape_type == "user":
-        snscrape_query = f"reddit-user {query}"
+        scraper_args = ['reddit-user', query]
     elif scrape_type == "search":
-        snscrape_query = f"reddit-search {query}"
+        scraper_args = ['reddit-search', query]
     else:
         raise ValueError(f"Invalid scrape type: {scrape_type}")
     
-    # Create a temporary file to store the JSON output
-    with tempfile.NamedTemporaryFile(delete=False, suffix='.json') as tmp_file:
-        tmp_filename = tmp_file.name
-    
     try:
-        # Run snscrape command to get Reddit data
-        command = f'snscrape --jsonl --max-results {limit} {snscrape_query} > {tmp_filename}'
-        subprocess.run(command, shell=True, check=True)
+        # Run snscrape and keep only the record fields the requested columns read
+        stand_ins = {field: REDDIT_SNSCRAPE_FIELDS[field] for field in fields if field in REDDIT_SNSCRAPE_FIELDS}
+        keep = set(fields) | set(stand_ins.values())
+        records = (
+            {field: value for field, value in record.items() if field in keep}
+            for record in _run_snscrape(scraper_args, limit)
+        )
+        posts_df = pd.DataFrame(list(records))
         
-        # Read the JSON file into a DataFrame
-        posts_df = pd.read_json(tmp_filename, lines=True)
+        # Handle different column names depending on the version of snscrape
+        columns = posts_df.columns
+        posts_df = posts_df.assign(**{
+            target: posts_df[source]
+            for target, source in stand_ins.items()
+            if target not in columns and source in columns
+        })
         
-        # Clean up the columns to match the expected output
-        if not posts_df.empty:
-            # Map common fields
-            posts_df['created_utc'] = pd.to_datetime(posts_df['date'])
-            
-            # Handle different column names depending on the version of snscrape
-            if 'title' not in posts_df.columns and 'content' in posts_df.columns:
-                posts_df['title'] = posts_df['content']
-            
-            if 'author' not in posts_df.columns and 'username' in posts_df.columns:
-                posts_df['author'] = posts_df['username']
-                
-            if 'score' not in posts_df.columns and 'upvoteCount' in posts_df.columns:
-                posts_df['score'] = posts_df['upvoteCount']
-                
-            if 'num_comments' not in posts_df.columns and 'commentCount' in posts_df.columns:
-                posts_df['num_comments'] = posts_df['commentCount']
-                
-            if 'permalink' not in posts_df.columns and 'url' in posts_df.columns:
-                posts_df['permalink'] = posts_df['url']
+        # Keep exactly the requested columns, adding any missing ones as empty
+        # columns in one step
+        posts_df = posts_df.reindex(columns=fields)
+        if 'created_utc' in posts_df.columns:
+            posts_df['created_utc'] = pd.to_datetime(posts_df['created_utc'], utc=True)
         
         return posts_df
     
     except Exception as e:
         raise Exception(f"Failed to scrape Reddit data: {str(e)}")
-    
-    finally:
-        # Clean up the temporary file
-        if os.path.exists(tmp_filename):
-            os.remove(tmp_filename)
@@ -0,0 +1,25 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+pd = pytest.importorskip("pandas")
+pytest.importorskip("plotly")
+
+from data_visualization import create_histogram
+
+
+def test_histogram_skips_infinite_values():
+    data = pd.DataFrame({"value": [1.0, 2.0, np.inf, 3.0, -np.inf, 4.0]})
+
+    fig = create_histogram(data, "value")
+
+    assert fig is not None
+    assert sum(fig.data[0].y) == 4
+
+
+def test_histogram_of_only_infinite_values_is_empty():
+    data = pd.DataFrame({"value": [np.inf, -np.inf, np.nan]})
+
+    fig = create_histogram(data, "value")
+
+    assert fig is not None
+    assert len(fig.data[0].y) == 0
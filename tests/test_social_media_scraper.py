@@ -0,0 +1,185 @@
+import os
+import sys
+import threading
+import types
+from datetime import datetime, timezone
+
+import pytest
+
+import social_media_scraper
+from social_media_scraper import scrape_reddit, scrape_twitter
+
+TWEETS = [
+    types.SimpleNamespace(
+        date=datetime(2024, 5, day, tzinfo=timezone.utc),
+        id=1000 + day,
+        rawContent=f"Reading book {day}",
+        user=types.SimpleNamespace(username=f"reader{day}"),
+        retweetCount=day,
+        likeCount=2 * day,
+        replyCount=0,
+        lang="es",
+        sourceLabel="Web",
+        url=f"https://twitter.com/reader{day}/status/{1000 + day}"
+    )
+    for day in range(1, 6)
+]
+
+POSTS = [
+    types.SimpleNamespace(
+        id=f"p{n}",
+        title=f"Book club {n}",
+        score=10 * n,
+        author=f"member{n}",
+        created_utc=1714521600.0 + 3600 * n,
+        num_comments=n,
+        url=f"https://example.com/{n}",
+        selftext="",
+        subreddit=types.SimpleNamespace(display_name="books"),
+        permalink=f"/r/books/comments/p{n}/"
+    )
+    for n in range(1, 4)
+]
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    # Keep every test's disk cache separate from the working tree
+    monkeypatch.setattr(social_media_scraper, "SCRAPE_CACHE_DIR", str(tmp_path))
+    return tmp_path
+
+
+@pytest.fixture
+def fake_snscrape(monkeypatch):
+    # Stand in for the snscrape Twitter module so no request leaves the test
+    class TwitterSearchScraper:
+        searches = 0
+
+        def __init__(self, query):
+            self.query = query
+
+        def get_items(self):
+            TwitterSearchScraper.searches += 1
+            return iter(TWEETS)
+
+    twitter = types.ModuleType("snscrape.modules.twitter")
+    twitter.TwitterSearchScraper = TwitterSearchScraper
+    modules = types.ModuleType("snscrape.modules")
+    modules.twitter = twitter
+    package = types.ModuleType("snscrape")
+    package.modules = modules
+
+    monkeypatch.setitem(sys.modules, "snscrape", package)
+    monkeypatch.setitem(sys.modules, "snscrape.modules", modules)
+    monkeypatch.setitem(sys.modules, "snscrape.modules.twitter", twitter)
+    return TwitterSearchScraper
+
+
+@pytest.fixture
+def fake_praw(monkeypatch):
+    # Stand in for PRAW and the Reddit client so no request leaves the test
+    class Listing:
+        def top(self, time_filter, limit):
+            return iter(POSTS[:limit])
+
+    class Reddit:
+        listings = 0
+
+        def subreddit(self, name):
+            Reddit.listings += 1
+            return Listing()
+
+    monkeypatch.setitem(sys.modules, "praw", types.ModuleType("praw"))
+    monkeypatch.setattr(social_media_scraper, "_get_reddit_client", lambda *args: (Reddit(), threading.Lock()))
+    return Reddit
+
+
+def test_fields_must_be_passed_by_keyword():
+    with pytest.raises(TypeError):
+        scrape_twitter("books", 10, ["id"])
+    with pytest.raises(TypeError):
+        scrape_reddit("subreddit", "books", 10, "all", ["id"])
+
+
+def test_unknown_fields_are_rejected_before_scraping():
+    with pytest.raises(ValueError, match="Unknown fields: likes"):
+        scrape_twitter("books", fields=["id", "likes"])
+    with pytest.raises(ValueError, match="Unknown fields: likes"):
+        scrape_reddit("subreddit", "books", fields=["likes"], use_cache=False)
+
+
+def test_cached_tweets_keep_their_dtypes(fake_snscrape):
+    pytest.importorskip("pandas")
+    pytest.importorskip("pyarrow")
+
+    scraped = scrape_twitter("books", 10)
+    cached = scrape_twitter("books", 10)
+
+    assert fake_snscrape.searches == 1
+    assert cached.dtypes.to_dict() == scraped.dtypes.to_dict()
+    assert cached["content"].dtype == "string[pyarrow]"
+
+
+def test_cache_hit_returns_the_scraped_tweets(fake_snscrape):
+    pd = pytest.importorskip("pandas")
+    pytest.importorskip("pyarrow")
+
+    for fields in (None, ["date", "user", "like_count", "language"]):
+        scraped = scrape_twitter("books", 10, fields=fields)
+        cached = scrape_twitter("books", 10, fields=fields)
+
+        pd.testing.assert_frame_equal(cached, scraped)
+
+    assert fake_snscrape.searches == 2
+
+
+def test_cache_hit_returns_the_scraped_reddit_posts(fake_praw):
+    pd = pytest.importorskip("pandas")
+    pytest.importorskip("pyarrow")
+
+    scraped = scrape_reddit("subreddit", "books", 3)
+    cached = scrape_reddit("subreddit", "books", 3)
+
+    assert fake_praw.listings == 1
+    pd.testing.assert_frame_equal(cached, scraped)
+
+
+def test_cache_entries_leave_no_temporary_files(fake_snscrape, cache_dir):
+    pytest.importorskip("pandas")
+    pytest.importorskip("pyarrow")
+
+    scrape_twitter("books", 10)
+    scrape_twitter("novels", 10)
+
+    names = os.listdir(cache_dir)
+    assert len(names) == 2
+    assert all(name.endswith(".parquet") for name in names)
+
+
+def test_expired_cache_entries_are_replaced(fake_snscrape, cache_dir):
+    pytest.importorskip("pandas")
+    pytest.importorskip("pyarrow")
+
+    scrape_twitter("books", 10)
+    (entry,) = cache_dir.iterdir()
+    expired = entry.stat().st_mtime - social_media_scraper.SCRAPE_CACHE_TTL - 1
+    os.utime(entry, (expired, expired))
+
+    scrape_twitter("books", 10)
+
+    assert fake_snscrape.searches == 2
+    assert [path.name for path in cache_dir.iterdir()] == [entry.name]
+    assert entry.stat().st_mtime > expired
+
+
+def test_zero_limit_returns_the_requested_columns(fake_snscrape):
+    pytest.importorskip("pandas")
+    pytest.importorskip("pyarrow")
+
+    tweets = scrape_twitter("books", 0, fields=["id", "content"], use_cache=False)
+
+    assert fake_snscrape.searches == 0
+    assert list(tweets.columns) == ["id", "content"]
+    assert len(tweets) == 0
+    assert tweets["id"].dtype == "int64"
+    assert tweets["content"].dtype == "string[pyarrow]"